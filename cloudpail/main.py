@@ -1,21 +1,147 @@
-import boto3
+import functools
+import itertools
 import os
 import sys
+import time
+import threading
 import mimetypes
-import pyperclip
-from botocore.exceptions import ClientError as CE, EndpointConnectionError
-from botocore.config import Config
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from rich.console import Console
 from rich.theme import Theme
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
+from rich.progress import Progress
+from rich.live import Live
 from rich.align import Align
 from rich import box
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
 from importlib.metadata import version, PackageNotFoundError
 
+# ======= LAZY IMPORTS =======
+
+# boto3/botocore parse megabytes of JSON service models on import and
+# InquirerPy pulls in prompt_toolkit, which together dominate cold start.
+# They are bound on first use instead of at module import; rich stays
+# eager because the console renders immediately.
+boto3 = None
+CE = None
+EndpointConnectionError = None
+S3UploadFailedError = None
+TRANSFER_CONFIG = None
+CLIENT_CONFIG = None
+inquirer = None
+Choice = None
+
+# Static menu choice lists, built once in _load_ui; rebuilding them every
+# loop iteration just re-allocated identical Choice objects.
+_MAIN_MENU_CHOICES = None
+_BUCKET_MENU_CHOICES = None
+_OBJECT_MENU_CHOICES = None
+_CANCEL_CHOICE = None
+
+
+def _load_aws():
+    """Binds the boto3/botocore globals on first use."""
+    global boto3, CE, EndpointConnectionError, S3UploadFailedError
+    global TRANSFER_CONFIG, CLIENT_CONFIG
+    if boto3 is not None:
+        return
+    import boto3 as _boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, EndpointConnectionError as _ece
+    from boto3.exceptions import S3UploadFailedError as _s3ufe
+    from boto3.s3.transfer import TransferConfig
+
+    boto3 = _boto3
+    CE = ClientError
+    EndpointConnectionError = _ece
+    # upload_file wraps ClientError in this Boto3Error subclass, so upload
+    # error handling must catch it alongside CE
+    S3UploadFailedError = _s3ufe
+
+    # Shared transfer tuning: concurrent multipart transfers for large objects.
+    # max_concurrency must stay below the client's max_pool_connections.
+    # preferred_transfer_client='auto' hands upload_file/download_file to the
+    # native CRT transfer manager when awscrt is installed (multipart GET/PUT
+    # in C, bypassing the GIL); without it boto3 keeps the classic path.
+    try:
+        TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=10,
+            max_io_queue=1000,
+            io_chunksize=1024 * 1024,
+            use_threads=True,
+            preferred_transfer_client="auto",
+        )
+    except TypeError:
+        # Older boto3 without CRT support in TransferConfig
+        TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=10,
+            max_io_queue=1000,
+            io_chunksize=1024 * 1024,
+            use_threads=True,
+        )
+
+    # Shared client config for every client this process builds (S3 and
+    # STS alike). max_pool_connections must stay >= the largest fan-out in
+    # play (16 upload workers, 10 transfer threads, 8 delete/list workers)
+    # or urllib3 silently serializes requests.
+    CLIENT_CONFIG = Config(
+        signature_version="s3v4",
+        max_pool_connections=32,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+        s3={
+            "addressing_style": "virtual",
+            # Transfer Acceleration is opt-in (requires the bucket
+            # feature to be enabled and incurs extra cost)
+            "use_accelerate_endpoint": os.getenv("CLOUDPAIL_ACCELERATE") == "1",
+        },
+    )
+
+
+def _load_ui():
+    """Binds the InquirerPy globals and static menus on first use."""
+    global inquirer, Choice
+    global _MAIN_MENU_CHOICES, _BUCKET_MENU_CHOICES, _OBJECT_MENU_CHOICES
+    global _CANCEL_CHOICE
+    if inquirer is not None:
+        return
+    from InquirerPy import inquirer as _inquirer
+    from InquirerPy.base.control import Choice as _choice
+
+    inquirer = _inquirer
+    Choice = _choice
+
+    _MAIN_MENU_CHOICES = [
+        Choice("bucket", name="Bucket Management"),
+        Choice("object", name="Object Management"),
+        Choice("profile", name="Switch AWS Profile"),
+        Choice("verify", name="Verify Credentials"),
+        Choice("quit", name="Exit Application"),
+    ]
+    _BUCKET_MENU_CHOICES = [
+        Choice("create", name="Create New Bucket"),
+        Choice("list", name="List All Buckets"),
+        Choice("delete", name="Delete Bucket"),
+        Choice("menu", name="« Return to Main Menu"),
+    ]
+    _OBJECT_MENU_CHOICES = [
+        Choice("list", name="List Objects"),
+        Choice("upload", name="Upload File"),
+        Choice("folder", name="Upload Folder (Recursive)"),
+        Choice("download", name="Download Object"),
+        Choice("meta", name="Inspect Metadata"),
+        Choice("presign", name="Generate Presigned URL"),
+        Choice("delete", name="Delete Object"),
+        Choice("bulk_delete", name="Delete Multiple Objects"),
+        Choice("menu", name="« Return to Main Menu"),
+    ]
+    _CANCEL_CHOICE = Choice(value=None, name="« Cancel")
+
 # ======= THEME & CONSOLE SETUP =======
 
 # Application theme configuration ("Matcha")
@@ -34,12 +160,83 @@ theme_matcha = Theme(
 
 console = Console(theme=theme_matcha)
 
+# Sessions are cached per profile so switching back is O(1) and reuses the
+# already-loaded credential chain.
+_session_cache = {}
+
+# S3 clients are cached per (profile, region) so toggling back to a profile
+# reuses the old client's warm urllib3 pool (live TLS sockets, kept alive by
+# tcp_keepalive) instead of handshaking from scratch.
+_client_cache = {}
+
 # Global Application State
 active_session = None
 active_client = None
 current_profile_name = "default"
 current_region = "us-east-1"
 
+# Backup-request hedging: duplicate a single-shot call after a short delay
+# and take whichever response returns first, cutting S3's occasional
+# multi-second tail stalls. Opt-in via CLOUDPAIL_HEDGE=1 because the
+# duplicate costs an extra request whenever the first one is merely slow.
+_HEDGE_DELAY = 0.15
+_hedge_pool = None
+
+
+def _hedged(fn, *args, **kwargs):
+    """Runs fn, issuing a backup call if the first doesn't answer quickly."""
+    global _hedge_pool
+    if os.getenv("CLOUDPAIL_HEDGE") != "1":
+        return fn(*args, **kwargs)
+
+    if _hedge_pool is None:
+        _hedge_pool = ThreadPoolExecutor(max_workers=4)
+
+    first = _hedge_pool.submit(fn, *args, **kwargs)
+    done, _ = wait([first], timeout=_HEDGE_DELAY)
+    if done:
+        return first.result()
+
+    backup = _hedge_pool.submit(fn, *args, **kwargs)
+    done, pending = wait([first, backup], return_when=FIRST_COMPLETED)
+    for loser in pending:
+        loser.cancel()
+    return done.pop().result()
+
+
+# Short-TTL cache for LIST results so menu re-entries don't re-hit AWS.
+# Entries map cache keys to (monotonic timestamp, result list).
+_LIST_CACHE_TTL = 30.0
+_list_cache = {}
+
+
+def _cache_get(key):
+    """Returns a cached LIST result if present and fresh, else None."""
+    entry = _list_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _LIST_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _cache_put(key, value):
+    """Stores a LIST result with the current timestamp."""
+    _list_cache[key] = (time.monotonic(), value)
+
+
+def _cache_invalidate(bucket_name=None):
+    """
+    Drops stale cache entries after a mutating operation.
+
+    Invalidates the bucket list and, when a bucket is given, any object
+    listings for that bucket.
+    """
+    _list_cache.pop(("buckets", current_profile_name), None)
+    if bucket_name is not None:
+        for key in [k for k in _list_cache if k[:3] == ("objects", current_profile_name, bucket_name)]:
+            _list_cache.pop(key, None)
+        for key in [k for k in _head_cache if k[0] == bucket_name]:
+            _head_cache.pop(key, None)
+
 # ======= UI SUPPORT =======
 
 # Try to fetch the installed version, fallback to 'dev' if running locally without install
@@ -48,17 +245,22 @@ try:
 except PackageNotFoundError:
     APP_VERSION = "dev"
 
-def print_banner():
-    """Displays the application branding and current session status."""
-    c = "[#7daea3]"
-    e = "[/]"
-
-    title_text = (
-        f"{c}   █▀▀ █   █▀█ █ █ █▀▄ █▀█ ▄▀█ █ █  {e}\n"
-        f"{c}   █▄▄ █▄▄ █▄█ █▄█ █▄▀ █▀▀ █▀█ █ █▄▄{e}\n"
+# The banner art is static, so parse its markup and centre it once instead
+# of rebuilding the renderable on every profile switch
+_BANNER_C = "[#7daea3]"
+_BANNER_E = "[/]"
+_BANNER_BODY = Align.center(
+    Text.from_markup(
+        f"{_BANNER_C}   █▀▀ █   █▀█ █ █ █▀▄ █▀█ ▄▀█ █ █  {_BANNER_E}\n"
+        f"{_BANNER_C}   █▄▄ █▄▄ █▄█ █▄█ █▄▀ █▀▀ █▀█ █ █▄▄{_BANNER_E}\n"
         f"\n[base]AWS S3 MANAGEMENT INTERFACE  ::  v{APP_VERSION}[/base]"
     )
+)
 
+
+def print_banner():
+    """Displays the application branding and current session status."""
+    # Only the profile/region subtitle is dynamic
     status_content = (
         f"[muted]Profile:[/muted] [bold highlight]{current_profile_name}[/bold highlight]   "
         f"[muted]Region:[/muted] [bold highlight]{current_region}[/bold highlight]"
@@ -66,7 +268,7 @@ def print_banner():
 
     console.print(
         Panel(
-            Align.center(Text.from_markup(title_text)),
+            _BANNER_BODY,
             border_style="border",
             expand=False,
             padding=(2, 8),
@@ -77,13 +279,46 @@ def print_banner():
     console.print()
 
 
+def verify_credentials():
+    """Explicitly validates the active profile's credentials via STS."""
+    if active_session is None:
+        console.print("[error]✖ No active session. Please verify connection.[/error]")
+        return False
+    try:
+        # Always a live STS call: the whole point of the explicit action is
+        # to prove the credentials work right now, so nothing is cached here
+        with console.status(
+            "[accent]Verifying credentials...[/]", spinner="aesthetic"
+        ):
+            # Same tuned config as the S3 client, so the check reuses
+            # the keep-alive and retry behavior
+            sts = active_session.client("sts", config=CLIENT_CONFIG)
+            identity = sts.get_caller_identity()
+
+        console.print(
+            f"[success]✔ Credentials valid.[/success] "
+            f"[muted]Account:[/muted] [highlight]{identity['Account']}[/highlight]  "
+            f"[muted]Identity:[/muted] [highlight]{identity['Arn']}[/highlight]"
+        )
+        return True
+    except EndpointConnectionError:
+        console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
+        return False
+    except CE as e:
+        console.print(f"[error]✖ Credential check failed: {e}[/error]")
+        return False
+
+
 def get_context_string():
     """Returns a formatted string of the active profile and region for menu headers."""
     return f"[dim]({current_profile_name} @ {current_region})[/dim]"
 
 
+@functools.lru_cache(maxsize=None)
 def get_available_profiles():
-    """Retrieves available AWS profiles from local configuration."""
+    """Retrieves available AWS profiles from local configuration (cached; the
+    config file doesn't change within one process)."""
+    _load_aws()
     return boto3.Session().available_profiles
 
 
@@ -95,37 +330,58 @@ def init_session(profile_name):
         profile_name (str): The name of the AWS profile to load.
 
     Returns:
-        bool: True if initialization and connectivity check succeed, False otherwise.
+        bool: True if initialization succeeds, False otherwise. Credential
+        validity is surfaced by the first AWS call or the explicit
+        'Verify Credentials' action rather than an upfront STS ping.
     """
     global active_session, active_client, current_profile_name, current_region
+    _load_aws()
+
     try:
-        active_session = boto3.Session(profile_name=profile_name)
+        if profile_name not in _session_cache:
+            _session_cache[profile_name] = boto3.Session(profile_name=profile_name)
+        active_session = _session_cache[profile_name]
 
         # Default to 'us-east-1' if region is unspecified in the profile
         region = active_session.region_name or "us-east-1"
         current_region = region
 
-        # Enforce regional endpoints to resolve potential signature compatibility issues
-        if region == "us-east-1":
-            endpoint = "https://s3.us-east-1.amazonaws.com"
-        else:
-            endpoint = f"https://s3.{region}.amazonaws.com"
-
-        # Initialize S3 client (Note: Client object creation is local and instant)
-        temp_client = active_session.client(
-            "s3",
-            region_name=region,
-            endpoint_url=endpoint,
-            config=Config(signature_version="s3v4"),
-        )
-
-        # Verify credentials and network reachability
-        sts = active_session.client("sts")
-        sts.get_caller_identity()
+        temp_client = _client_cache.get((profile_name, region))
+        if temp_client is None:
+            # Initialize S3 client (Note: Client object creation is local and instant)
+            # Botocore resolves the regional endpoint from its partition data, so
+            # no hand-built endpoint_url is needed; virtual-hosted addressing
+            # keeps requests on the correct regional domain.
+            temp_client = active_session.client(
+                "s3",
+                region_name=region,
+                config=CLIENT_CONFIG,
+            )
+            _client_cache[(profile_name, region)] = temp_client
 
-        # Commit to global state only after successful verification
+        # Credentials are validated lazily: the first real S3 call raises
+        # the same errors the old STS ping surfaced, without charging every
+        # profile switch a round-trip. An explicit check lives in the
+        # 'Verify Credentials' menu action.
         active_client = temp_client
         current_profile_name = profile_name
+        _list_cache.clear()
+
+        # Pre-warm the TLS connection pool in the background and prefetch
+        # the bucket list into the TTL cache: the user spends the next
+        # second reading the banner and picking a menu entry, and nearly
+        # every path needs the buckets first, so the round-trip overlaps
+        # with think-time and bucket_listing usually hits the cache.
+        def _warm(client, profile):
+            try:
+                buckets = client.list_buckets().get("Buckets", [])
+                _cache_put(("buckets", profile), buckets)
+            except Exception:
+                pass  # Warm-up is best-effort; real calls surface errors
+
+        threading.Thread(
+            target=_warm, args=(temp_client, profile_name), daemon=True
+        ).start()
         return True
 
     except EndpointConnectionError:
@@ -144,12 +400,36 @@ def init_session(profile_name):
         return False
 
 
+# Display cap for listing tables; anything beyond is summarized in a footer
+_MAX_TABLE_ROWS = 200
+
+# Units for format_size, indexed by power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_size(size_bytes):
-    """Formats a byte count into a human-readable string (KB/MB)."""
-    if size_bytes >= 1048576:
-        return f"{size_bytes / 1048576:.2f} MB"
-    else:
-        return f"{size_bytes / 1024:.2f} KB"
+    """Formats a byte count into a human-readable string (auto-scaled B..TB)."""
+    if size_bytes <= 0:
+        return "0 B"
+    # Pick the unit from the bit width: one branchless lookup, one division
+    i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
+
+
+@functools.lru_cache(maxsize=256)
+def _mime_for(ext):
+    """Returns the MIME type for a lowercased extension, memoized so a folder
+    of 10k same-type files resolves the type once instead of per file."""
+    return mimetypes.guess_type("x" + ext)[0] or "binary/octet-stream"
+
+
+def _size_str(obj):
+    """Returns the object's formatted size, memoized on the LIST entry so
+    re-renders of cached listings skip the formatting work."""
+    formatted = obj.get("_size_str")
+    if formatted is None:
+        formatted = obj["_size_str"] = format_size(obj["Size"])
+    return formatted
 
 
 def select_bucket_interactive(client):
@@ -159,6 +439,7 @@ def select_bucket_interactive(client):
     Returns:
         str or None: The selected bucket name, or None if cancelled/empty.
     """
+    _load_ui()
     if client is None:
         console.print("[error]✖ No active session. Please verify connection.[/error]")
         return None
@@ -170,42 +451,74 @@ def select_bucket_interactive(client):
         console.print("[warning]⚠ No buckets found in this region.[/warning]")
         return None
 
-    choices = [Choice(b["Name"], name=b["Name"]) for b in buckets]
-    choices.append(Choice(value=None, name="« Cancel"))
+    choices = [*(Choice(b["Name"], name=b["Name"]) for b in buckets), _CANCEL_CHOICE]
 
     return inquirer.select(
         message="Select Bucket:", choices=choices, default=None, pointer="⟢"
     ).execute()
 
 
+# Last prefix filter used per bucket, so re-entering the selector on the
+# same bucket defaults to the previous narrowing
+_last_prefix = {}
+
+
 def select_object_interactive(client, bucket_name):
     """
     Prompts the user to select an object from the specified bucket.
 
     Returns:
-        str or None: The selected object key, or None if cancelled/empty.
+        dict or None: The selected object's LIST entry (Key, Size,
+        LastModified, ...), or None if cancelled/empty.
     """
+    _load_ui()
+
+    # Server-side Prefix filtering lets users of large buckets narrow to the
+    # keys they want in a single LIST instead of scrolling a truncated view
+    prefix = inquirer.text(
+        message="Filter by prefix (optional):",
+        default=_last_prefix.get(bucket_name, ""),
+    ).execute()
+    _last_prefix[bucket_name] = prefix
+
     with console.status(
         f"[accent]Scanning objects in {bucket_name}...[/]", spinner="aesthetic"
     ):
-        objects = object_listing(client, bucket_name)
+        # Fetch one extra entry beyond the display cap to detect truncation
+        objects = list(
+            itertools.islice(
+                object_listing(client, bucket_name, max_keys=51, prefix=prefix), 51
+            )
+        )
 
     if not objects:
-        console.print("[warning]⚠ Bucket is currently empty.[/warning]")
+        if prefix:
+            console.print(
+                f"[warning]⚠ No objects match prefix '{prefix}'.[/warning]"
+            )
+        else:
+            console.print("[warning]⚠ Bucket is currently empty.[/warning]")
         return None
 
-    # Display file size alongside key name for context
+    # The 51st entry only signals truncation and is never displayed
+    truncated = len(objects) > 50
+
+    # Return the full LIST entry so callers can reuse its metadata without
+    # a follow-up HEAD; display file size alongside key name for context.
+    # Build the final list in one allocation.
     choices = [
-        Choice(o["Key"], name=f"{o['Key']}  ({format_size(o['Size'])})")
-        for o in objects[:50]
+        *(
+            Choice(o, name=f"{o['Key']}  ({_size_str(o)})")
+            for o in objects[:50]
+        ),
+        *(
+            [Choice(value=None, name="... (List truncated for performance)")]
+            if truncated
+            else []
+        ),
+        _CANCEL_CHOICE,
     ]
 
-    # Implement basic truncation for performance
-    if len(objects) > 50:
-        choices.append(Choice(value=None, name="... (List truncated for performance)"))
-
-    choices.append(Choice(value=None, name="« Cancel"))
-
     return inquirer.select(
         message="Select Object:", choices=choices, default=None, pointer="⟢"
     ).execute()
@@ -214,93 +527,181 @@ def select_object_interactive(client, bucket_name):
 # ======= BACKEND: BUCKET OPS =======
 
 
+def aws_op(default=None, message="Operation Failed"):
+    """
+    Wraps a backend function with the standard AWS error handling.
+
+    Network failures and ClientErrors are reported on the console with the
+    given message prefix and the wrapped function returns `default`, which
+    keeps the repeated two-branch try/except out of every happy path and
+    gives retries/backoff a single place to live later.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except EndpointConnectionError:
+                console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
+                return default
+            except (CE, S3UploadFailedError) as e:
+                console.print(f"[error]✖ {message}: {e}[/error]")
+                return default
+
+        return wrapper
+
+    return decorator
+
+
 def bucket_listing(client):
     """Fetches a list of all buckets owned by the authenticated sender."""
+    cached = _cache_get(("buckets", current_profile_name))
+    if cached is not None:
+        return cached
     try:
-        response = client.list_buckets()
-        return response.get("Buckets", [])
+        response = _hedged(client.list_buckets)
+        buckets = response.get("Buckets", [])
+        _cache_put(("buckets", current_profile_name), buckets)
+        return buckets
     except EndpointConnectionError:
         console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
         return []
     except CE as e:
-        console.print(f"[error]✖ Failed to list buckets: {e}[/error]")
+        # Bad credentials surface here now that init_session skips its
+        # upfront STS ping
+        if e.response["Error"]["Code"] in (
+            "InvalidClientTokenId",
+            "SignatureDoesNotMatch",
+            "ExpiredToken",
+        ):
+            console.print(
+                f"[error]✖ Failed to load profile '{current_profile_name}': {e}[/error]"
+            )
+        else:
+            console.print(f"[error]✖ Failed to list buckets: {e}[/error]")
         return []
 
 
+@aws_op(default=False, message="Creation Failed")
 def bucket_creation(client, bucket_name, region):
     """Creates a new S3 bucket in the specified region."""
     if not region:
         region = "us-east-1"
-    try:
-        # 'us-east-1' requires no LocationConstraint
-        if region == "us-east-1":
-            client.create_bucket(Bucket=bucket_name)
-        else:
-            client.create_bucket(
-                Bucket=bucket_name,
-                CreateBucketConfiguration={"LocationConstraint": region},
-            )
-        return True
-    except EndpointConnectionError:
-        console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
-        return False
-    except CE as e:
-        console.print(f"[error]✖ Creation Failed: {e}[/error]")
-        return False
+    # 'us-east-1' requires no LocationConstraint
+    if region == "us-east-1":
+        client.create_bucket(Bucket=bucket_name)
+    else:
+        client.create_bucket(
+            Bucket=bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": region},
+        )
+    _cache_invalidate()
+    return True
+
+
+# Versioning status rarely changes mid-session, so remember it per bucket
+_versioning_cache = {}
+
 
+def _bucket_versioning_status(client, bucket_name):
+    """Returns the bucket's versioning status ('Enabled'/'Suspended'/None), cached."""
+    if bucket_name not in _versioning_cache:
+        response = client.get_bucket_versioning(Bucket=bucket_name)
+        _versioning_cache[bucket_name] = response.get("Status")
+    return _versioning_cache[bucket_name]
 
+
+@aws_op(default=False, message="Could not determine if bucket is empty")
 def is_bucket_empty(client, bucket_name):
     """Checks if a bucket is truly empty (containing no objects, versions, or delete markers)."""
-    try:
+    # The cheap single-key LIST settles the common (non-versioned) case
+    response = client.list_objects_v2(Bucket=bucket_name, MaxKeys=1)
+    if response.get("KeyCount", 0) > 0:
+        return False
+
+    # Only versioned buckets can hide old versions or delete markers
+    # behind an empty current listing
+    if _bucket_versioning_status(client, bucket_name) in ("Enabled", "Suspended"):
         response = client.list_object_versions(Bucket=bucket_name, MaxKeys=1)
         return not ("Versions" in response or "DeleteMarkers" in response)
-    except EndpointConnectionError:
-        console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
-        return False
-    except CE as e:
-        console.print(f"[error]✖ Could not determine if bucket is empty: {e}[/error]")
-        return False
+    return True
+
+
+# S3's batch-delete API accepts at most 1000 keys per call
+_DELETE_BATCH_SIZE = 1000
+
+
+def delete_objects_batched(client, bucket_name, objects, workers=8):
+    """
+    Deletes object identifiers in batches of up to 1000 keys per API call.
+
+    Batches are dispatched to a small thread pool so in-flight DELETEs can
+    overlap with the caller's next LIST page. Accepts an iterable of
+    {'Key': ...} or {'Key': ..., 'VersionId': ...} dicts.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        buf = []
+        for obj in objects:
+            buf.append(obj)
+            if len(buf) >= _DELETE_BATCH_SIZE:
+                batch, buf = buf[:_DELETE_BATCH_SIZE], buf[_DELETE_BATCH_SIZE:]
+                futures.append(
+                    executor.submit(
+                        client.delete_objects,
+                        Bucket=bucket_name,
+                        Delete={"Objects": batch, "Quiet": True},
+                    )
+                )
+        # Flush the remainder after the source is exhausted
+        if buf:
+            futures.append(
+                executor.submit(
+                    client.delete_objects,
+                    Bucket=bucket_name,
+                    Delete={"Objects": buf, "Quiet": True},
+                )
+            )
+        for future in as_completed(futures):
+            future.result()
 
 
+@aws_op(default=False, message="Operation Failed")
 def bucket_emptying(client, bucket_name):
     """Recursively deletes all objects, versions, and delete markers in a bucket."""
     console.print(f"[muted]» Preparing to clear '{bucket_name}'...[/muted]")
-    try:
-        with console.status(
-            "[accent]Removing objects and versions...[/]", spinner="aesthetic"
-        ):
-            paginator = client.get_paginator("list_object_versions")
+    with console.status(
+        "[accent]Removing objects and versions...[/]", spinner="aesthetic"
+    ):
+        paginator = client.get_paginator("list_object_versions")
+
+        def iter_versions():
             for page in paginator.paginate(Bucket=bucket_name):
-                to_delete = []
                 for v in page.get("Versions", []):
-                    to_delete.append({"Key": v["Key"], "VersionId": v["VersionId"]})
+                    yield {"Key": v["Key"], "VersionId": v["VersionId"]}
                 for dm in page.get("DeleteMarkers", []):
-                    to_delete.append({"Key": dm["Key"], "VersionId": dm["VersionId"]})
+                    yield {"Key": dm["Key"], "VersionId": dm["VersionId"]}
 
-                if to_delete:
-                    client.delete_objects(
-                        Bucket=bucket_name, Delete={"Objects": to_delete}
-                    )
-        return True
-    except EndpointConnectionError:
-        console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
-        return False
-    except CE as e:
-        console.print(f"[error]✖ Operation Failed: {e}[/error]")
-        return False
+        delete_objects_batched(client, bucket_name, iter_versions())
+    _cache_invalidate(bucket_name)
+    return True
 
 
 def bucket_deletion(client, bucket_name):
     """Deletes a bucket, offering recursive cleanup if it is not empty."""
+    _load_ui()
     try:
-        # Step 1: Verify empty status
-        with console.status(
-            "[accent]Verifying bucket status...[/]", spinner="aesthetic"
-        ):
-            empty = is_bucket_empty(client, bucket_name)
-
-        # Step 2: Offer recursive deletion if content exists
-        if not empty:
+        # Delete speculatively: the empty-bucket fast path costs one round-trip
+        # and a non-empty bucket is reported back as BucketNotEmpty
+        try:
+            with console.status("[accent]Deleting bucket...[/]", spinner="aesthetic"):
+                client.delete_bucket(Bucket=bucket_name)
+        except CE as e:
+            if e.response["Error"]["Code"] != "BucketNotEmpty":
+                raise
+
+            # Offer recursive deletion, then retry
             console.print(f"[warning]⚠ Bucket '{bucket_name}' is not empty.[/warning]")
             confirm = inquirer.confirm(
                 message="Recursively delete all contents and the bucket?", default=False
@@ -312,13 +713,13 @@ def bucket_deletion(client, bucket_name):
             if not bucket_emptying(client, bucket_name):
                 return False
 
-        # Step 3: Perform deletion
-        with console.status("[accent]Deleting bucket...[/]", spinner="aesthetic"):
-            client.delete_bucket(Bucket=bucket_name)
+            with console.status("[accent]Deleting bucket...[/]", spinner="aesthetic"):
+                client.delete_bucket(Bucket=bucket_name)
 
         console.print(
             f"[success]✔ Bucket '{bucket_name}' successfully deleted.[/success]"
         )
+        _cache_invalidate(bucket_name)
         return True
     except EndpointConnectionError:
         console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
@@ -331,34 +732,208 @@ def bucket_deletion(client, bucket_name):
 # ======= BACKEND: OBJECT OPS =======
 
 
+# HEAD responses are stable enough to memoize briefly for repeat inspections
+_HEAD_CACHE_TTL = 60.0
+_head_cache = {}
+
+
+def _head_many(client, bucket_name, keys, workers=8):
+    """
+    Fetches head_object for several keys concurrently.
+
+    Results are memoized for a minute so re-inspecting the same object
+    doesn't re-hit S3. Returns a dict mapping key -> HEAD response.
+    """
+    now = time.monotonic()
+    results = {}
+    missing = []
+    for key in keys:
+        entry = _head_cache.get((bucket_name, key))
+        if entry and now - entry[1] < _HEAD_CACHE_TTL:
+            results[key] = entry[0]
+        else:
+            missing.append(key)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            futures = {
+                executor.submit(client.head_object, Bucket=bucket_name, Key=key): key
+                for key in missing
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                response = future.result()
+                _head_cache[(bucket_name, key)] = (response, time.monotonic())
+                results[key] = response
+    return results
+
+
 def check_object_exists(client, bucket_name, key):
-    """Verifies existence of an object using a lightweight HEAD request."""
+    """
+    Verifies existence of an object using a lightweight HEAD request.
+
+    Returns a plain bool: only a 404/NotFound means "doesn't exist"; any
+    other error (permissions, network) propagates to the caller instead of
+    masquerading as a missing object.
+    """
     try:
-        client.head_object(Bucket=bucket_name, Key=key)
+        _hedged(client.head_object, Bucket=bucket_name, Key=key)
         return True
-    except EndpointConnectionError:
-        console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
-        return None
-    except CE:
+    except CE as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+
+
+def _fanout_listing(client, bucket_name, root_response):
+    """
+    Lists a bucket by fanning one paginator per top-level prefix out to a
+    thread pool, merging results through a queue.
+
+    LIST pagination is sequential per continuation token, so hierarchical
+    buckets list roughly P times faster when the P top-level prefixes are
+    walked concurrently. The shared client is thread-safe.
+    """
+    import queue
+
+    prefixes = [p["Prefix"] for p in root_response.get("CommonPrefixes", [])]
+    results = queue.Queue(maxsize=4096)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        """Queue put that gives up once the consumer has gone away.
+
+        A plain blocking put would deadlock if the generator is closed
+        early (render error, Ctrl+C): nobody drains the bounded queue, and
+        executor shutdown would join workers parked on it forever.
+        """
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
         return False
 
+    # Worker failures are recorded rather than printed, then re-raised to
+    # the consumer below so they flow through object_listing's handlers
+    # exactly like a serial-path failure (message printed, nothing cached)
+    errors = []
+
+    def worker(prefix):
+        try:
+            paginator = client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(
+                Bucket=bucket_name,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": 1000},
+            ):
+                for obj in page.get("Contents", []):
+                    if not put(obj):
+                        return
+        except (EndpointConnectionError, CE) as e:
+            errors.append(e)
+        finally:
+            put(done)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        try:
+            for prefix in prefixes:
+                executor.submit(worker, prefix)
+
+            # Root-level keys already arrived with the delimiter probe
+            yield from root_response.get("Contents", [])
+
+            remaining = len(prefixes)
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+
+            # A failed prefix means the merged listing is incomplete;
+            # surface it instead of passing the truncation off as success
+            if errors:
+                raise errors[0]
+        finally:
+            # Covers early generator close as well as normal completion;
+            # workers notice within one put timeout and exit, so the
+            # executor's shutdown(wait=True) can't hang
+            stop.set()
+
+
+def object_listing(client, bucket_name, max_keys=None, parallel=False, prefix=""):
+    """
+    Streams objects in a bucket lazily, one LIST page at a time.
 
-def object_listing(client, bucket_name):
-    """Retrieves all objects in a bucket using pagination."""
+    Args:
+        max_keys (int, optional): Upper bound on yielded objects; keeps the
+            interactive paths at a single round-trip instead of paginating
+            through the whole bucket.
+        parallel (bool): For full listings of buckets with several top-level
+            prefixes, fan one paginator per prefix out to a thread pool.
+        prefix (str): Server-side key prefix filter, passed through to
+            ListObjectsV2 so filtering never pages the whole bucket.
+
+    Yields:
+        dict: Object entries as returned by ListObjectsV2.
+    """
+    cache_key = ("objects", current_profile_name, bucket_name, max_keys, prefix)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        yield from cached
+        return
+    collected = []
     try:
+        if parallel and max_keys is None and not prefix:
+            # A single delimiter probe reveals the top-level layout; fall
+            # back to the serial paginator when the root is truncated (the
+            # prefix set would be incomplete) or too flat to gain anything
+            root = client.list_objects_v2(Bucket=bucket_name, Delimiter="/")
+            if not root.get("IsTruncated") and len(root.get("CommonPrefixes", [])) >= 4:
+                for obj in _fanout_listing(client, bucket_name, root):
+                    collected.append(obj)
+                    yield obj
+                _cache_put(cache_key, collected)
+                return
+
         paginator = client.get_paginator("list_objects_v2")
-        results = []
-        for page in paginator.paginate(Bucket=bucket_name):
-            results.extend(page.get("Contents", []))
-        return results
+        if max_keys is not None:
+            pages = paginator.paginate(
+                Bucket=bucket_name,
+                Prefix=prefix,
+                PaginationConfig={
+                    "MaxItems": max_keys,
+                    "PageSize": min(max_keys, 1000),
+                },
+            )
+        else:
+            # Full pages (the S3 maximum) minimize the number of LIST calls
+            pages = paginator.paginate(
+                Bucket=bucket_name,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": 1000},
+            )
+        for page in pages:
+            for obj in page.get("Contents", []):
+                collected.append(obj)
+                # Bounded listings are complete once the cap is reached;
+                # cache before yielding, because the consumer stops there
+                # and never resumes the generator past this suspension
+                if max_keys is not None and len(collected) == max_keys:
+                    _cache_put(cache_key, collected)
+                yield obj
+        # Only cache listings that completed without error
+        _cache_put(cache_key, collected)
     except EndpointConnectionError:
         console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
-        return []
     except CE as e:
         console.print(f"[error]✖ Failed to list objects: {e}[/error]")
-        return []
 
 
+@aws_op(default=False, message="Upload Failed")
 def object_uploading(client, path, bucket_name, key):
     """Uploads a local file to S3 with auto-detected Content-Type."""
     if not os.path.exists(path):
@@ -366,105 +941,208 @@ def object_uploading(client, path, bucket_name, key):
         return False
 
     # Detect MIME type to ensure correct browser rendering
-    mime_type, _ = mimetypes.guess_type(path)
-    if not mime_type:
-        mime_type = "binary/octet-stream"
+    mime_type = _mime_for(os.path.splitext(path)[1].lower())
 
-    try:
-        with console.status(f"[accent]Uploading {key}...[/]", spinner="aesthetic"):
-            client.upload_file(
-                Filename=path,
-                Bucket=bucket_name,
-                Key=key,
-                ExtraArgs={"ContentType": mime_type},
-            )
-        console.print(f"[success]✔ Upload Complete: {key}[/success]")
-        return True
-    except EndpointConnectionError:
-        console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
-        return False
-    except CE as e:
-        console.print(f"[error]✖ Upload Failed: {e}[/error]")
-        return False
+    # Byte-level progress instead of an indeterminate spinner
+    with Progress(console=console) as progress:
+        task = progress.add_task(
+            f"[accent]Uploading {key}...", total=os.path.getsize(path)
+        )
+        client.upload_file(
+            Filename=path,
+            Bucket=bucket_name,
+            Key=key,
+            ExtraArgs={"ContentType": mime_type, "ChecksumAlgorithm": "CRC32"},
+            Config=TRANSFER_CONFIG,
+            Callback=lambda sent: progress.advance(task, sent),
+        )
+    console.print(f"[success]✔ Upload Complete: {key}[/success]")
+    _cache_invalidate(bucket_name)
+    return True
+
+
+# Files below this size skip the transfer manager for a direct PutObject
+_PUT_OBJECT_CUTOFF = 8 * 1024 * 1024
+
+
+def _upload_one(client, path, bucket_name, key):
+    """Uploads a single file without UI output (worker-thread variant of object_uploading)."""
+    mime_type = _mime_for(os.path.splitext(path)[1].lower())
+
+    # Small files go straight to PutObject: reading the body here means
+    # this worker's disk read overlaps with the other workers' sends, and
+    # it skips the transfer manager's per-file future/submission machinery,
+    # which dominates cost when the payload is tiny. Large files keep the
+    # multipart path.
+    if os.path.getsize(path) < _PUT_OBJECT_CUTOFF:
+        with open(path, "rb") as f:
+            body = f.read()
+        client.put_object(
+            Bucket=bucket_name,
+            Key=key,
+            Body=body,
+            ContentType=mime_type,
+            ChecksumAlgorithm="CRC32",
+        )
+        return
+
+    # CRC32 is hardware-accelerated and far cheaper per chunk than MD5
+    client.upload_file(
+        Filename=path,
+        Bucket=bucket_name,
+        Key=key,
+        ExtraArgs={"ContentType": mime_type, "ChecksumAlgorithm": "CRC32"},
+        Config=TRANSFER_CONFIG,
+    )
+
+
+def _iter_upload_files(folder_path):
+    """
+    Walks a directory with os.scandir and yields (local_path, s3_key) pairs.
+
+    DirEntry reuses the stat data from readdir, and the key is sliced from
+    the entry path directly, avoiding the join/relpath string work os.walk
+    would do per file. Unreadable or vanished directories are skipped, as
+    os.walk does by default, so one bad subdirectory (or a mistyped folder
+    path) can't abort the batch with a traceback.
+    """
+    base = os.path.normpath(folder_path)
+    base_len = len(base) + 1
+
+    def walk(directory):
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+        with entries as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from walk(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    # Normalize paths to S3 format (forward slashes)
+                    yield entry.path, entry.path[base_len:].replace(os.sep, "/")
+
+    yield from walk(base)
 
 
 def object_folder_uploading(client, bucket_name, folder_path):
-    """recursively uploads a directory to S3, maintaining folder structure."""
+    """Recursively uploads a directory to S3 in parallel, maintaining folder structure."""
     console.print(f"[accent]» Initiating batch upload from: {folder_path}[/accent]")
+
+    # Uploads are I/O-bound, so run them concurrently over the shared client
+    # (boto3 clients are thread-safe; pool size is raised in init_session).
+    # Submitting straight from the walker lets the first uploads start while
+    # the directory tree is still being traversed. Failures are collected
+    # rather than aborting the batch, so one bad file can't cancel the
+    # independent uploads around it.
     count = 0
-    for root, dirs, files in os.walk(folder_path):
-        for file in files:
-            local = os.path.join(root, file)
-            relative = os.path.relpath(local, folder_path)
-            # Normalize paths to S3 format (forward slashes)
-            key = relative.replace("\\", "/")
-
-            # Terminate batch on failure to prevent error flooding
-            if not object_uploading(client, local, bucket_name, key):
-                console.print(
-                    "[warning]⚠ Batch upload interrupted due to error.[/warning]"
-                )
-                return
-            count += 1
+    errors = []
+    with Progress(console=console) as progress:
+        task = progress.add_task("[accent]Uploading...", total=None)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {
+                executor.submit(_upload_one, client, local, bucket_name, key): key
+                for local, key in _iter_upload_files(folder_path)
+            }
+            progress.update(task, total=len(futures))
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    count += 1
+                except EndpointConnectionError:
+                    errors.append((futures[future], "Network Error"))
+                except (CE, S3UploadFailedError, OSError) as e:
+                    errors.append((futures[future], str(e)))
+                progress.advance(task)
+
+    if not futures:
+        console.print("[warning]⚠ No files found in the selected folder.[/warning]")
+        return
+
+    if errors:
+        for key, reason in errors[:10]:
+            console.print(f"[error]✖ Upload Failed ({key}): {reason}[/error]")
+        if len(errors) > 10:
+            console.print(f"[error]  ... and {len(errors) - 10} more.[/error]")
+
+    _cache_invalidate(bucket_name)
     console.print(
-        f"\n[success]✔ Batch Operation Complete. {count} files processed.[/success]"
+        f"\n[success]✔ Batch Operation Complete. {count} files processed, "
+        f"{len(errors)} failed.[/success]"
     )
 
 
+@aws_op(message="Download Failed")
 def object_downloading(client, bucket_name, key):
     """Downloads an S3 object to the current working directory."""
-    try:
-        dl_name = "downloaded_" + os.path.basename(key)
-        with console.status(f"[accent]Downloading {key}...[/]", spinner="aesthetic"):
-            client.download_file(Bucket=bucket_name, Key=key, Filename=dl_name)
-        console.print(f"[success]✔ Download Saved: {dl_name}[/success]")
-    except EndpointConnectionError:
-        console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
-    except CE as e:
-        console.print(f"[error]✖ Download Failed: {e}[/error]")
+    dl_name = "downloaded_" + os.path.basename(key)
+    with Progress(console=console) as progress:
+        task = progress.add_task(f"[accent]Downloading {key}...", total=None)
+        client.download_file(
+            Bucket=bucket_name,
+            Key=key,
+            Filename=dl_name,
+            Config=TRANSFER_CONFIG,
+            Callback=lambda recvd: progress.advance(task, recvd),
+        )
+    console.print(f"[success]✔ Download Saved: {dl_name}[/success]")
 
 
 def object_deletion(client, bucket_name, key):
-    """Deletes a specific object after verification."""
-    with console.status("[accent]Verifying object...[/]", spinner="aesthetic"):
-        exists = check_object_exists(client, bucket_name, key)
-
-    if exists is None:
-        return False
-
-    if not exists:
-        console.print(f"[error]✖ Error: Object '{key}' could not be found.[/error]")
-        return False
-
+    """Deletes a specific object in a single round-trip."""
+    # DeleteObject is idempotent, so no verification HEAD is needed first
     try:
         with console.status(f"[accent]Removing {key}...[/]", spinner="aesthetic"):
             client.delete_object(Bucket=bucket_name, Key=key)
         console.print(f"[success]✔ Object '{key}' successfully deleted.[/success]")
+        _cache_invalidate(bucket_name)
         return True
     except EndpointConnectionError:
         console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
         return False
     except CE as e:
-        console.print(f"[error]✖ Deletion Failed: {e}[/error]")
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            console.print(f"[error]✖ Error: Object '{key}' could not be found.[/error]")
+        else:
+            console.print(f"[error]✖ Deletion Failed: {e}[/error]")
         return False
 
 
-def object_meta_data(client, bucket_name, key):
-    """Fetches and displays metadata (Size, MIME, LastMod) for an object."""
-    try:
-        response = client.head_object(Bucket=bucket_name, Key=key)
+def object_meta_data(client, bucket_name, obj):
+    """
+    Displays metadata for an object, reusing fields from its LIST entry.
 
+    Size and LastModified already arrived with the listing, so the HEAD
+    request (for the MIME type) only fires when explicitly requested.
+    """
+    _load_ui()
+    key = obj["Key"]
+    try:
         console.print()
         table = Table(title="Object Properties", border_style="border", box=box.ROUNDED)
         table.add_column("Property", style="accent", justify="right")
         table.add_column("Value", style="base")
 
         table.add_row("Key Name", key)
-        table.add_row("Size", format_size(response["ContentLength"]))
-        table.add_row("MIME Type", response["ContentType"])
-        table.add_row("Last Modified", str(response["LastModified"]))
+        if "Size" in obj:
+            table.add_row("Size", format_size(obj["Size"]))
+        if "LastModified" in obj:
+            table.add_row("Last Modified", str(obj["LastModified"]))
+        if "ETag" in obj:
+            table.add_row("ETag", obj["ETag"].strip('"'))
+        if "StorageClass" in obj:
+            table.add_row("Storage Class", obj["StorageClass"])
 
         console.print(table)
+
+        # The MIME type is the only field LIST doesn't carry
+        fetch_full = inquirer.confirm(
+            message="Fetch full metadata (MIME type)?", default=False
+        ).execute()
+        if fetch_full:
+            with console.status("[accent]Fetching metadata...[/]", spinner="aesthetic"):
+                response = _head_many(client, bucket_name, [key])[key]
+            console.print(f"[muted]MIME Type:[/muted] [base]{response['ContentType']}[/base]")
     except EndpointConnectionError:
         console.print("[error]✖ Network Error: Cannot connect to AWS.[/error]")
     except CE:
@@ -485,7 +1163,25 @@ def object_pre_sign(client, bucket_name, key):
         )
         console.print(f"[link={url}]{url}[/link]", soft_wrap=True)
 
-        pyperclip.copy(url)
+        # Clipboard backends can fork pbcopy/xclip and block ~100 ms, so copy
+        # in the background while the URL prints immediately
+        def _copy(text):
+            try:
+                import pyperclip
+
+                pyperclip.copy(text)
+            except Exception:
+                # No native backend (headless box, SSH session): fall back to
+                # the OSC-52 escape, which modern terminals translate into a
+                # clipboard write on the *local* machine. Harmless no-op on
+                # terminals that don't support it; the URL is already printed.
+                import base64
+
+                payload = base64.b64encode(text.encode()).decode()
+                sys.stdout.write(f"\x1b]52;c;{payload}\x07")
+                sys.stdout.flush()
+
+        threading.Thread(target=_copy, args=(url,), daemon=True).start()
         console.print("[accent](URL copied to clipboard)[/accent]")
 
     except CE as e:
@@ -497,6 +1193,7 @@ def object_pre_sign(client, bucket_name, key):
 
 def bucket_operation_menu():
     """Handles the sub-menu for bucket-level operations."""
+    _load_ui()
     if active_client is None:
         console.print(
             "[error]✖ No active session. Please check your connection.[/error]"
@@ -510,12 +1207,7 @@ def bucket_operation_menu():
         )
         op = inquirer.select(
             message="Select Action:",
-            choices=[
-                Choice("create", name="Create New Bucket"),
-                Choice("list", name="List All Buckets"),
-                Choice("delete", name="Delete Bucket"),
-                Choice("menu", name="« Return to Main Menu"),
-            ],
+            choices=_BUCKET_MENU_CHOICES,
             default="list",
             pointer="⟢",
         ).execute()
@@ -542,10 +1234,14 @@ def bucket_operation_menu():
                 )
                 t.add_column("Bucket Name", style="highlight")
                 t.add_column("Creation Date", style="muted")
-                for b in buckets:
+                for b in buckets[:_MAX_TABLE_ROWS]:
                     t.add_row(
                         b["Name"], str(b["CreationDate"].strftime("%Y-%m-%d %H:%M"))
                     )
+                if len(buckets) > _MAX_TABLE_ROWS:
+                    t.add_row(
+                        f"[muted]... {len(buckets) - _MAX_TABLE_ROWS} more[/muted]", ""
+                    )
                 console.print(t)
             else:
                 console.print("[muted]No buckets found in this region.[/muted]")
@@ -558,6 +1254,7 @@ def bucket_operation_menu():
 
 def object_operation_menu():
     """Handles the sub-menu for object-level operations."""
+    _load_ui()
     if active_client is None:
         console.print(
             "[error]✖ No active session. Please check your connection.[/error]"
@@ -577,16 +1274,7 @@ def object_operation_menu():
         )
         op = inquirer.select(
             message="Select Action:",
-            choices=[
-                Choice("list", name="List Objects"),
-                Choice("upload", name="Upload File"),
-                Choice("folder", name="Upload Folder (Recursive)"),
-                Choice("download", name="Download Object"),
-                Choice("meta", name="Inspect Metadata"),
-                Choice("presign", name="Generate Presigned URL"),
-                Choice("delete", name="Delete Object"),
-                Choice("menu", name="« Return to Main Menu"),
-            ],
+            choices=_OBJECT_MENU_CHOICES,
             default="list",
             pointer="⟢",
         ).execute()
@@ -595,21 +1283,27 @@ def object_operation_menu():
             break
 
         if op == "list":
-            with console.status("[accent]Indexing...[/]", spinner="aesthetic"):
-                objs = object_listing(active_client, bucket)
-            if objs:
-                console.print()
-                t = Table(
-                    border_style="border",
-                    box=box.ROUNDED,
-                    title=f"Contents of {bucket}",
-                )
-                t.add_column("Object Key", style="base")
-                t.add_column("Size", style="muted", justify="right")
-                for o in objs:
-                    t.add_row(o["Key"], format_size(o["Size"]))
-                console.print(t)
-            else:
+            t = Table(
+                border_style="border",
+                box=box.ROUNDED,
+                title=f"Contents of {bucket}",
+            )
+            t.add_column("Object Key", style="base")
+            t.add_column("Size", style="muted", justify="right")
+            count = 0
+            console.print()
+            # Render rows live as LIST pages arrive, so the first page is
+            # visible before the full listing completes. Rendering is capped
+            # at 200 rows -- the terminal can't usefully show more -- while
+            # the remainder is only counted, never materialized.
+            with Live(t, console=console, refresh_per_second=8):
+                for o in object_listing(active_client, bucket, parallel=True):
+                    if count < _MAX_TABLE_ROWS:
+                        t.add_row(o["Key"], _size_str(o))
+                    count += 1
+                if count > _MAX_TABLE_ROWS:
+                    t.add_row(f"[muted]... {count - _MAX_TABLE_ROWS} more[/muted]", "")
+            if not count:
                 console.print("[warning]⚠ Bucket is currently empty.[/warning]")
 
         elif op == "upload":
@@ -627,21 +1321,69 @@ def object_operation_menu():
             if path:
                 object_folder_uploading(active_client, bucket, path)
 
+        elif op == "bulk_delete":
+            with console.status("[accent]Indexing...[/]", spinner="aesthetic"):
+                objs = list(
+                    itertools.islice(
+                        object_listing(active_client, bucket, max_keys=50), 50
+                    )
+                )
+            if not objs:
+                console.print("[warning]⚠ Bucket is currently empty.[/warning]")
+                continue
+            selected = inquirer.checkbox(
+                message="Select objects to delete (space to toggle):",
+                choices=[
+                    Choice(o["Key"], name=f"{o['Key']}  ({_size_str(o)})")
+                    for o in objs[:50]
+                ],
+                pointer="⟢",
+            ).execute()
+            if not selected:
+                continue
+            confirm = inquirer.confirm(
+                message=f"Permanently delete {len(selected)} object(s)?", default=False
+            ).execute()
+            if confirm:
+                try:
+                    with console.status(
+                        "[accent]Removing objects...[/]", spinner="aesthetic"
+                    ):
+                        delete_objects_batched(
+                            active_client, bucket, [{"Key": k} for k in selected]
+                        )
+                    _cache_invalidate(bucket)
+                    console.print(
+                        f"[success]✔ Deleted {len(selected)} object(s).[/success]"
+                    )
+                except EndpointConnectionError:
+                    console.print(
+                        "[error]✖ Network Error: Cannot connect to AWS.[/error]"
+                    )
+                except CE as e:
+                    console.print(f"[error]✖ Deletion Failed: {e}[/error]")
+
         elif op in ["download", "meta", "presign", "delete"]:
             target = select_object_interactive(active_client, bucket)
             if target:
                 if op == "download":
-                    object_downloading(active_client, bucket, target)
+                    object_downloading(active_client, bucket, target["Key"])
                 elif op == "meta":
                     object_meta_data(active_client, bucket, target)
                 elif op == "presign":
-                    object_pre_sign(active_client, bucket, target)
+                    object_pre_sign(active_client, bucket, target["Key"])
                 elif op == "delete":
-                    object_deletion(active_client, bucket, target)
+                    object_deletion(active_client, bucket, target["Key"])
 
 
 def main():
     """Main application entry point."""
+    _load_ui()
+
+    # Load the MIME table once so per-file guesses in upload worker threads
+    # are plain dict lookups instead of lazy first-call initialization
+    mimetypes.init()
+
     try:
         # Enforce profile selection at start to ensure valid session state
         profiles = get_available_profiles()
@@ -674,12 +1416,7 @@ def main():
             # The inquirer prompt will raise KeyboardInterrupt if Ctrl+C is pressed
             op = inquirer.select(
                 message="System Operation:",
-                choices=[
-                    Choice("bucket", name="Bucket Management"),
-                    Choice("object", name="Object Management"),
-                    Choice("profile", name="Switch AWS Profile"),
-                    Choice("quit", name="Exit Application"),
-                ],
+                choices=_MAIN_MENU_CHOICES,
                 pointer="⟢",
             ).execute()
 
@@ -693,6 +1430,8 @@ def main():
                 ).execute()
                 if init_session(p):
                     print_banner()
+            elif op == "verify":
+                verify_credentials()
             else:
                 console.print("[warning]Session terminated. Exiting application.[/warning]")
                 sys.exit(0)